@@ -98,16 +98,22 @@ Start:
 import os      # For file existence check
 import re      # For regex validation
 import csv     # For reading/writing CSV files
-from send_email import EmailSender # SMTP and email-related imports
-# import smtplib
-# from email.mime.text import MIMEText
-# from email.mime.multipart import MIMEMultipart
+import sys     # For string interning
+from departments import DepartmentDictionary # Department name -> integer code mapping
+# send_email (and with it smtplib/email.mime) is imported lazily on first send,
+# payroll on the first salary projection, change_feed on the first roster change
 
 
 # -1- File Handling Configuration ---
 FILE_NAME = "employees.csv" # Name of the CSV file to persist data
 DELIMITER = ","             # Delimiter used in CSV
 EMPLOYEE_KEYS = ["ID", "Name", "Department", "Salary", "Contact"]  # CSV headers
+CHANGE_FEED_FILE = "employees_changes.jsonl"  # Append-only JSON-lines feed of roster changes
+PROFILE_DIR_ENV = "EMS_PROFILE_DIR"           # Env var enabling session profiling (same as --profile DIR)
+
+# -1b- Email Configuration ---
+SENDER_EMAIL_ENV = "EMS_SENDER_EMAIL"         # Env var holding the Gmail sender address
+SENDER_PASSWORD_ENV = "EMS_SENDER_PASSWORD"   # Env var holding the Gmail app password
 
 # -2- Validation Helper Functions ---
 def validate_employee_id(emp_id):
@@ -131,22 +137,58 @@ def validate_contact(contact):
     return bool(re.fullmatch(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", contact)) and len(contact) <= 20
 
 
+# -2b- Normalized Keys ---
+def contact_key(contact):
+    """Returns the casefolded lookup key for a contact email."""
+    key = contact.casefold()
+    return contact if key == contact else key # Reuse the original string when already folded
+
+DEPARTMENTS = DepartmentDictionary() # Shared by all Employee objects
+
+def format_employee(emp_id, name, department, salary, contact):
+    """Formats employee details for display (also used for previews that must not register a department)."""
+    return (f"ID: {emp_id}\nName: {name}\nDepartment: {department}\n"
+            f"Salary: ${float(salary):.2f}\nContact: {contact}\n" + "-"*40)
+
+
 # -3- # --- Employee Class ---
 class Employee:
     """Class to represent an Employee"""
 
+    # Fixed attributes keep per-employee memory low for large rosters
+    __slots__ = ("emp_id", "name", "_department", "dept_code", "salary", "_contact", "contact_key")
+
     def __init__(self, emp_id, name, department, salary, contact):
         # Initialize employee attributes
         self.emp_id = emp_id
         self.name = name
-        self.department = department
+        self.department = department # Also sets dept_code
         self.salary = float(salary) # Stored as float for calculations
-        self.contact = contact
+        self.contact = contact # Also sets contact_key
+
+    @property
+    def department(self):
+        return self._department
+
+    @department.setter
+    def department(self, department):
+        # Share one string and one integer code per distinct department
+        self.dept_code = DEPARTMENTS.code(department)
+        self._department = sys.intern(department)
+
+    @property
+    def contact(self):
+        return self._contact
+
+    @contact.setter
+    def contact(self, contact):
+        # Keep the casefolded key alongside so comparisons don't re-fold every time
+        self._contact = contact
+        self.contact_key = contact_key(contact)
     
     def __str__(self):
         # Return a string representation of the employee details
-        return (f"ID: {self.emp_id}\nName: {self.name}\nDepartment: {self.department}\n"
-                f"Salary: ${self.salary:.2f}\nContact: {self.contact}\n" + "-"*40)
+        return format_employee(self.emp_id, self.name, self.department, self.salary, self.contact)
 
     def to_dict(self):
         # Return a dictionary of the employee details
@@ -162,12 +204,55 @@ class Employee:
 # -4- # --- Employee Management System Class ---
 class EmployeeManagementSystem:
     """Class to manage employees"""
-    def __init__(self):
+    def __init__(self, change_feed_file=None, profiler=None):
+        # Optional SessionProfiler; wraps menu actions and persistence on this instance only
+        if profiler:
+            profiler.instrument(self)
         # Initialize the list to store employees
         # Loads employee records on startup
         self.employees = self.load_employees()
-        ## Use app password from Gmail [point to send_email.py]
-        self.email_sender = EmailSender("wt.wn01@gmail.com", "kejl uxmj ohhg ujhr") # Use app password from Gmail
+        # Event bus for add/update/delete notifications (payroll, directory sync, ...)
+        # Built on first use (see events property), so read-only sessions start no threads
+        self.change_feed_file = change_feed_file
+        self.change_feed = None
+        self._events = None
+        # Email sender is built on first use (see email_sender property)
+        self._email_sender = None
+
+    @property
+    def email_sender(self):
+        """Return the EmailSender, constructing it on first access; None if no credentials are configured."""
+        if self._email_sender is None:
+            ## Use app password from Gmail, read from the environment [point to send_email.py]
+            sender_email = os.environ.get(SENDER_EMAIL_ENV, "")
+            sender_password = os.environ.get(SENDER_PASSWORD_ENV, "")
+            if not sender_email or not sender_password:
+                return None # Not cached, so credentials set later are still picked up
+            from send_email import EmailSender # Deferred: pulls in smtplib and email.mime
+            self._email_sender = EmailSender(sender_email, sender_password)
+        return self._email_sender
+
+    @email_sender.setter
+    def email_sender(self, sender):
+        # Allows a custom or mocked sender to be injected (e.g. in tests)
+        self._email_sender = sender
+
+    @property
+    def events(self):
+        """Return the EventBus, importing change_feed and attaching the feed file on first access."""
+        if self._events is None:
+            from change_feed import EventBus, ChangeFeed # Deferred: pulls in json, queue and threading
+            if self.change_feed_file:
+                self.change_feed = ChangeFeed(self.change_feed_file)
+            self._events = EventBus(self.change_feed.last_sequence() if self.change_feed else 0)
+            if self.change_feed:
+                self._events.subscribe(self.change_feed.append)
+        return self._events
+
+    def close_events(self):
+        """Deliver pending change events and stop subscriber threads, if the bus was ever built."""
+        if self._events is not None:
+            self._events.close()
 
     # -1- File Operations ---
     def load_employees(self):
@@ -189,19 +274,70 @@ class EmployeeManagementSystem:
         return employees
 
     def save_employees(self):
-        """Save employees to CSV file."""
+        """Save employees to CSV file. Returns True if the file was written."""
         try:
             with open(FILE_NAME, 'w', newline='') as f:
                 writer = csv.DictWriter(f, fieldnames=EMPLOYEE_KEYS, delimiter=DELIMITER)
                 writer.writeheader()
                 for emp in self.employees:
                     writer.writerow(emp.to_dict())
+            return True
         except Exception as e:
             print(f"Error saving employees: {e}")
+            return False
 
     def find_employee_by_id(self, emp_id):
         return next((emp for emp in self.employees if emp.emp_id == emp_id), None)
 
+    def contact_in_use(self, contact, exclude_id=None):
+        """Checks whether a contact email is already used (case-insensitive) by another employee."""
+        key = contact_key(contact)
+        return any(emp.contact_key == key and emp.emp_id != exclude_id for emp in self.employees)
+
+
+    # -2- Salary Analytics ---
+    def project_salaries(self, scenarios):
+        """
+        Project per-department salary totals for many scenarios without changing the roster.
+        Totals are unrounded estimates: apply_salary_scenario rounds each salary to cents,
+        so a committed total can differ by up to half a cent per affected employee.
+        """
+        from payroll import PayrollProjector # Deferred: only needed for salary analytics
+        return PayrollProjector(self.employees, DEPARTMENTS).project(scenarios)
+
+    def apply_salary_scenario(self, scenario):
+        """Apply a salary scenario to every employee and save once. Returns the number of employees changed."""
+        try:
+            scenario.resolve(DEPARTMENTS)
+            changes = []
+            for emp in self.employees:
+                rule = scenario.rule_for(emp.dept_code)
+                if rule is None:
+                    continue
+                # Round to cents so memory, the CSV file and published events agree
+                new_salary = round(rule.apply(emp.salary), 2)
+                if new_salary != emp.salary:
+                    changes.append((emp, emp.to_dict(), new_salary))
+
+            # Commit all changes with a single save, then notify subscribers
+            for emp, _, new_salary in changes:
+                emp.salary = new_salary
+            if not self.save_employees():
+                # Roll back so memory keeps matching the CSV file
+                for emp, before, _ in changes:
+                    emp.salary = float(before["Salary"])
+                print(f"Scenario '{scenario.name}' was not applied.")
+                return 0
+            from change_feed import EVENT_UPDATE
+            for emp, before, _ in changes:
+                self.events.publish(EVENT_UPDATE, emp.emp_id, before, emp.to_dict())
+
+            print(f"Scenario '{scenario.name}' applied to {len(changes)} employee(s).")
+            return len(changes)
+        except Exception as e:
+            print(f"Error applying salary scenario: {e}")
+            return 0
+
 
     def add_employee(self):
         """Add a new employee with unique ID and email validation, with confirmation before saving."""
@@ -237,7 +373,7 @@ class EmployeeManagementSystem:
 
             # Prompt and validate contact email
             contact = input("Enter Contact Email: ").strip()
-            if not validate_contact(contact) or any(emp.contact.lower() == contact.lower() for emp in self.employees):
+            if not validate_contact(contact) or self.contact_in_use(contact):
                 print("Invalid or duplicate Contact Email.")
                 return
 
@@ -259,7 +395,13 @@ class EmployeeManagementSystem:
             # Create and store new employee
             new_emp = Employee(emp_id, name, dept, salary, contact)
             self.employees.append(new_emp)
-            self.save_employees()
+            if not self.save_employees():
+                # Roll back so memory keeps matching the CSV file and the change feed
+                self.employees.remove(new_emp)
+                print("Employee was not added.")
+                return
+            from change_feed import EVENT_ADD
+            self.events.publish(EVENT_ADD, emp_id, None, new_emp.to_dict())
             print("Employee added successfully.")
 
             # Send confirmation email
@@ -271,7 +413,11 @@ class EmployeeManagementSystem:
                 f"Your registered email is {contact}.\n\n"
                 "Thank you,\nHR Department"
             )
-            self.email_sender.send_email(name, contact, subject, body)
+            sender = self.email_sender
+            if sender is None:
+                print(f"Welcome email not sent: set {SENDER_EMAIL_ENV} and {SENDER_PASSWORD_ENV} to enable email.")
+            else:
+                sender.send_email(name, contact, subject, body)
 
         except Exception as e:
             print(f"Error adding employee: {e}")
@@ -341,15 +487,6 @@ class EmployeeManagementSystem:
             new_salary = input(f"New salary [{emp.salary}]: ").strip()
             new_contact = input(f"New email [{emp.contact}]: ").strip()
 
-            # Create a temporary updated employee object with new/old values
-            updated_emp = Employee(
-                emp_id=emp.emp_id,  # Keep original ID
-                name=new_name if new_name else emp.name,
-                department=new_dept if new_dept else emp.department,
-                salary=new_salary if new_salary else emp.salary,
-                contact=new_contact if new_contact else emp.contact
-            )
-
             # --- VALIDATION SECTION ---
             # Validate new name if provided
             if new_name and not validate_name(new_name):
@@ -373,25 +510,41 @@ class EmployeeManagementSystem:
                     return
 
                 # Ensure new contact is not used by another employee
-                if any(e.contact.lower() == new_contact.lower() and e.emp_id != emp.emp_id for e in self.employees):
+                if self.contact_in_use(new_contact, exclude_id=emp.emp_id):
                     print("Email already exists for another employee.")
                     return
 
+            # Merge new/old values; kept as plain values so a cancelled
+            # update never registers its department in DEPARTMENTS
+            updated_name = new_name if new_name else emp.name
+            updated_dept = new_dept if new_dept else emp.department
+            updated_salary = float(new_salary) if new_salary else emp.salary
+            updated_contact = new_contact if new_contact else emp.contact
+
             # Show updated employee preview
             print("\n📋 Preview of Updated Information:")
-            print(updated_emp)
+            print(format_employee(emp.emp_id, updated_name, updated_dept, updated_salary, updated_contact))
 
             # Ask for confirmation before saving
             confirm = input("⚠️ Save these changes? (yes/no): ").strip().lower()
             if confirm == "yes":
-                # Apply validated changes to the original employee object
-                emp.name = updated_emp.name
-                emp.department = updated_emp.department
-                emp.salary = float(updated_emp.salary)  # Ensure salary is float
-                emp.contact = updated_emp.contact
+                # Snapshot current values for the change event
+                before = emp.to_dict()
+                old_values = (emp.name, emp.department, emp.salary, emp.contact)
 
-                # Save all employees to file
-                self.save_employees()
+                # Apply validated changes to the original employee object
+                emp.name = updated_name
+                emp.department = updated_dept
+                emp.salary = updated_salary
+                emp.contact = updated_contact
+
+                # Save all employees to file; roll back if that failed
+                if not self.save_employees():
+                    emp.name, emp.department, emp.salary, emp.contact = old_values
+                    print(f"Employee {emp_id} was not updated.")
+                    return
+                from change_feed import EVENT_UPDATE
+                self.events.publish(EVENT_UPDATE, emp_id, before, emp.to_dict())
                 print(f"Employee {emp_id} updated successfully.")
             else:
                 print("Update cancelled.")
@@ -427,10 +580,16 @@ class EmployeeManagementSystem:
             confirm_delete = input("⚠️ Are you sure you want to delete this employee? (yes/no): ").strip().lower()
             if confirm_delete == "yes":
                 # Remove the employee object from the employees list
-                self.employees.remove(emp)
+                index = self.employees.index(emp)
+                self.employees.pop(index)
 
-                # Save the updated list to the CSV file
-                self.save_employees()
+                # Save the updated list to the CSV file; put the employee back if that failed
+                if not self.save_employees():
+                    self.employees.insert(index, emp)
+                    print(f"Employee {emp_id} was not deleted.")
+                    return
+                from change_feed import EVENT_DELETE
+                self.events.publish(EVENT_DELETE, emp_id, emp.to_dict(), None)
 
                 # Provide feedback that deletion was successful
                 print(f"Employee {emp_id} deleted successfully.")
@@ -474,8 +633,9 @@ class EmployeeManagementSystem:
             # Prompt user for department name to search
             dept_name = input("Enter department to filter: ").strip().lower()
 
-            # Filter employees matching the department (case-insensitive)
-            matching_employees = [emp for emp in self.employees if emp.department.lower() == dept_name]
+            # Filter employees matching the department (case-insensitive) by integer code
+            dept_code = DEPARTMENTS.lookup(dept_name)
+            matching_employees = [emp for emp in self.employees if emp.dept_code == dept_code]
 
             # Check if any employees found in the department
             if not matching_employees:
@@ -537,6 +697,8 @@ class EmployeeManagementSystem:
             elif choice == '6':
                 self.department_wise_report()
             elif choice == '7':
+                # Deliver any pending change events before leaving
+                self.close_events()
                 print("Exiting the system.")
                 break
             else:
@@ -544,5 +706,22 @@ class EmployeeManagementSystem:
 
 # Start the program
 if __name__ == "__main__":
-    ems = EmployeeManagementSystem()
-    ems.main_menu()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="BitFutura Employee Management System")
+    parser.add_argument("--profile", metavar="DIR", default=os.environ.get(PROFILE_DIR_ENV),
+                        help=f"write per-action profiles to DIR (or set {PROFILE_DIR_ENV})")
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile:
+        from session_profiler import SessionProfiler # Only imported when profiling is requested
+        profiler = SessionProfiler(args.profile)
+
+    ems = EmployeeManagementSystem(change_feed_file=CHANGE_FEED_FILE, profiler=profiler)
+    try:
+        ems.main_menu()
+    finally:
+        # Deliver queued change events even on Ctrl-C or end of input
+        ems.close_events()
+        if profiler:
+            profiler.print_summary()
\ No newline at end of file
@@ -0,0 +1,291 @@
+import os
+import json
+import time
+import queue
+import threading
+
+
+# Event types emitted for roster mutations
+EVENT_ADD = "add"
+EVENT_UPDATE = "update"
+EVENT_DELETE = "delete"
+EVENT_TYPES = (EVENT_ADD, EVENT_UPDATE, EVENT_DELETE)
+
+
+class RosterEvent:
+    '''
+    A single change to the employee roster.
+    '''
+    def __init__(self, seq, event_type, emp_id, before, after, timestamp=None):
+        '''
+        Initialize the RosterEvent instance.
+
+        :param seq: Monotonic sequence number of the event.
+        :param event_type: One of EVENT_ADD, EVENT_UPDATE or EVENT_DELETE.
+        :param emp_id: ID of the employee the event refers to.
+        :param before: Field values before the change (None for adds).
+        :param after: Field values after the change (None for deletes).
+        :param timestamp: Unix time of the change (defaults to now).
+        '''
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        self.seq = seq
+        self.event_type = event_type
+        self.emp_id = emp_id
+        self.before = before
+        self.after = after
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def changed_fields(self):
+        '''
+        Return the names of the fields whose values differ between before and after.
+        '''
+        before = self.before or {}
+        after = self.after or {}
+        return [key for key in sorted(set(before) | set(after)) if before.get(key) != after.get(key)]
+
+    def to_dict(self):
+        # Converts the event to a dict for JSON serialisation
+        return {
+            "seq": self.seq,
+            "type": self.event_type,
+            "emp_id": self.emp_id,
+            "before": self.before,
+            "after": self.after,
+            "timestamp": self.timestamp
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        # Rebuilds an event from a dict read back from the change feed
+        return cls(data["seq"], data["type"], data["emp_id"], data["before"], data["after"], data["timestamp"])
+
+
+class _Subscription:
+    '''
+    A subscriber callback with its own queue and delivery thread, so a slow
+    subscriber never blocks the publisher or the other subscribers.
+    '''
+    def __init__(self, callback):
+        self.callback = callback
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            event = self.queue.get()
+            try:
+                if event is None:  # Stop signal
+                    return
+                self.callback(event)
+            except Exception as e:
+                print(f"Error delivering event {event.seq}: {e}")
+            finally:
+                self.queue.task_done()
+
+
+class EventBus:
+    '''
+    In-process publisher of roster change events.
+    '''
+    def __init__(self, start_seq=0):
+        '''
+        Initialize the EventBus instance.
+
+        :param start_seq: Last sequence number already issued; the next event gets start_seq + 1.
+        '''
+        self.seq = start_seq
+        self._subscriptions = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        '''
+        Register a callback that receives every RosterEvent published from now on.
+
+        :param callback: Callable taking a single RosterEvent.
+        :return: A function that removes the subscription when called.
+        '''
+        subscription = _Subscription(callback)
+        with self._lock:
+            self._subscriptions.append(subscription)
+
+        def unsubscribe():
+            with self._lock:
+                if subscription not in self._subscriptions:
+                    return
+                self._subscriptions.remove(subscription)
+            subscription.queue.put(None)
+        return unsubscribe
+
+    def publish(self, event_type, emp_id, before=None, after=None):
+        '''
+        Emit a change event to all subscribers without waiting for delivery.
+
+        :param event_type: One of EVENT_ADD, EVENT_UPDATE or EVENT_DELETE.
+        :param emp_id: ID of the employee that changed.
+        :param before: Field values before the change.
+        :param after: Field values after the change.
+        :return: The published RosterEvent.
+        '''
+        with self._lock:
+            self.seq += 1
+            event = RosterEvent(self.seq, event_type, emp_id, before, after)
+            # Enqueue under the lock so every subscriber sees events in sequence order
+            for subscription in self._subscriptions:
+                subscription.queue.put(event)
+        return event
+
+    def flush(self):
+        '''
+        Block until every published event has been delivered to every subscriber.
+        '''
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.queue.join()
+
+    def close(self):
+        '''
+        Deliver any pending events and stop all subscriber threads.
+        '''
+        with self._lock:
+            subscriptions = self._subscriptions
+            self._subscriptions = []
+        for subscription in subscriptions:
+            subscription.queue.put(None)
+        for subscription in subscriptions:
+            subscription.thread.join()
+
+
+class ChangeFeed:
+    '''
+    Append-only JSON-lines file of roster change events.
+    Can be subscribed to an EventBus directly: bus.subscribe(feed.append).
+    '''
+    def __init__(self, file_name):
+        '''
+        Initialize the ChangeFeed instance.
+
+        :param file_name: Path of the JSON-lines feed file.
+        '''
+        self.file_name = file_name
+        self._tail_checked = False  # Partial trailing line removed before the first append
+
+    def append(self, event):
+        '''
+        Append one event as a single JSON line.
+
+        :param event: The RosterEvent to record.
+        '''
+        if not self._tail_checked:
+            self._truncate_partial_line()
+            self._tail_checked = True
+        with open(self.file_name, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event.to_dict()) + "\n")
+
+    def last_sequence(self):
+        '''
+        Return the sequence number of the last complete event in the feed (0 if empty or missing).
+        A half-written trailing line (e.g. after a crash during append) is ignored.
+        '''
+        if not os.path.exists(self.file_name):
+            return 0
+        with open(self.file_name, 'rb') as f:
+            end = self._complete_end(f)
+            # Read backwards in chunks until the last complete line is found
+            chunk_size = 4096
+            data = b""
+            position = end
+            while position > 0:
+                step = min(chunk_size, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+                lines = data.rstrip().split(b"\n")
+                if len(lines) > 1 or position == 0:
+                    last = lines[-1].strip()
+                    return json.loads(last)["seq"] if last else 0
+        return 0
+
+    def _complete_end(self, f):
+        # Return the offset just after the last newline, i.e. the end of the last complete line
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            index = f.read(step).rfind(b"\n")
+            if index != -1:
+                return position + index + 1
+        return 0
+
+    def _truncate_partial_line(self):
+        # Drop a half-written trailing line so the next event starts on a line of its own
+        if not os.path.exists(self.file_name):
+            return
+        with open(self.file_name, 'r+b') as f:
+            end = self._complete_end(f)
+            f.seek(0, os.SEEK_END)
+            if f.tell() != end:
+                f.truncate(end)
+
+
+class ChangeFeedCursor:
+    '''
+    Resumable reader position in a ChangeFeed, persisted to its own file so
+    a consumer only processes events it has not yet committed.
+    '''
+    def __init__(self, feed, cursor_file):
+        '''
+        Initialize the ChangeFeedCursor instance.
+
+        :param feed: The ChangeFeed to read from.
+        :param cursor_file: Path of the file storing the committed position.
+        '''
+        self.feed = feed
+        self.cursor_file = cursor_file
+        self.seq = 0      # Last committed sequence number
+        self.offset = 0   # Byte offset in the feed just after the last committed event
+        self._pending = None
+        if os.path.exists(cursor_file):
+            with open(cursor_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.seq = data["seq"]
+            self.offset = data["offset"]
+
+    def poll(self, limit=None):
+        '''
+        Return the events written after the committed position.
+
+        :param limit: Maximum number of events to return (all if None).
+        :return: List of RosterEvent objects in sequence order.
+        '''
+        events = []
+        offset = self.offset
+        if os.path.exists(self.feed.file_name):
+            with open(self.feed.file_name, 'rb') as f:
+                f.seek(self.offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Partially written line; pick it up on the next poll
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    events.append(RosterEvent.from_dict(json.loads(line)))
+                    if limit is not None and len(events) >= limit:
+                        break
+        self._pending = (events[-1].seq if events else self.seq, offset)
+        return events
+
+    def commit(self):
+        '''
+        Persist the position reached by the last poll so the next run resumes after it.
+        '''
+        if self._pending is None:
+            return
+        self.seq, self.offset = self._pending
+        self._pending = None
+        with open(self.cursor_file, 'w', encoding='utf-8') as f:
+            json.dump({"seq": self.seq, "offset": self.offset}, f)
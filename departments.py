@@ -0,0 +1,27 @@
+import sys
+
+
+def department_key(department):
+    """Returns the normalized, interned lookup key for a department name."""
+    return sys.intern(" ".join(department.split()).casefold()) # Case- and spacing-insensitive
+
+
+class DepartmentDictionary:
+    """Maps normalized department keys to small integer codes."""
+
+    def __init__(self):
+        self.codes = {} # department key -> code
+        self.names = [] # code -> first department name seen
+
+    def code(self, department):
+        """Returns the code for a department, assigning a new one if unseen."""
+        key = department_key(department)
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.names)
+            self.names.append(sys.intern(department))
+        return code
+
+    def lookup(self, department):
+        """Returns the code for a department, or None if no employee has used it."""
+        return self.codes.get(department_key(department))
@@ -0,0 +1,153 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from departments import department_key
+
+
+class RaiseRule:
+    '''
+    A percentage raise (or cut) with an optional cap, for one department or for all.
+    '''
+    def __init__(self, percent, department=None, cap=None):
+        '''
+        Initialize the RaiseRule instance.
+
+        :param percent: Raise in percent, e.g. 3 for +3% (negative for a cut, not below -100).
+        :param department: Department the rule applies to (None for every department).
+        :param cap: Maximum salary a raise may reach. Employees already above it keep their salary.
+        '''
+        if percent < -100:
+            raise ValueError("Raise percent cannot be below -100.")
+        self.percent = percent
+        self.department = department
+        self.cap = cap
+        self.factor = 1 + percent / 100
+
+    def apply(self, salary):
+        '''
+        Return the salary after this rule (used when committing a scenario).
+
+        :param salary: Current salary.
+        '''
+        raised = salary * self.factor
+        if self.cap is None or raised <= salary:
+            return raised
+        return min(raised, max(salary, self.cap))
+
+    def project_total(self, salaries, prefix):
+        '''
+        Return the total of apply() over a department without visiting each salary.
+
+        :param salaries: The department's salaries, sorted ascending.
+        :param prefix: Prefix sums of salaries (prefix[i] = sum of the first i salaries).
+        '''
+        total = prefix[-1]
+        if self.cap is None or self.factor <= 1:
+            return total * self.factor
+        # Salaries up to cap/factor get the full raise, those between that and
+        # the cap are lifted to the cap, and those at or above the cap are unchanged
+        full = bisect_right(salaries, self.cap / self.factor)
+        capped = bisect_left(salaries, self.cap, full)
+        return prefix[full] * self.factor + self.cap * (capped - full) + (total - prefix[capped])
+
+
+class SalaryScenario:
+    '''
+    A named what-if payroll change made of raise rules.
+    A department-specific rule takes precedence over a rule for all departments.
+    '''
+    def __init__(self, name, rules):
+        '''
+        Initialize the SalaryScenario instance.
+
+        :param name: Label used in projections, e.g. "+3% Engineering capped".
+        :param rules: List of RaiseRule objects, at most one per department and one default.
+        '''
+        # Reject duplicates up front so validity does not depend on who is on the roster
+        seen = set()
+        for rule in rules:
+            key = None if rule.department is None else department_key(rule.department)
+            if key in seen:
+                raise ValueError(f"Scenario '{name}' has more than one rule for {rule.department or 'all departments'}.")
+            seen.add(key)
+        defaults = [rule for rule in rules if rule.department is None]
+        self.name = name
+        self.rules = rules
+        self.default = defaults[0] if defaults else None
+        self.by_department = {}  # department code -> RaiseRule, filled by resolve()
+
+    def resolve(self, departments):
+        '''
+        Map department-specific rules to department codes.
+
+        :param departments: The DepartmentDictionary used by the roster.
+        '''
+        self.by_department = {}
+        for rule in self.rules:
+            if rule.department is not None:
+                code = departments.lookup(rule.department)
+                if code is not None:  # Rules for departments with no employees change nothing
+                    self.by_department[code] = rule
+
+    def rule_for(self, dept_code):
+        # Return the rule applying to a department, or None if it is unaffected
+        return self.by_department.get(dept_code, self.default)
+
+
+class PayrollProjector:
+    '''
+    Evaluates salary scenarios against a snapshot of the roster's salary column.
+    The roster itself is never modified.
+    '''
+    def __init__(self, employees, departments):
+        '''
+        Group salaries by department once, sorted and with prefix sums, so each
+        scenario costs O(departments * log n) regardless of roster size.
+
+        :param employees: List of Employee objects.
+        :param departments: The DepartmentDictionary the employees' dept_code values come from.
+        '''
+        self.departments = departments
+        columns = {}
+        for emp in employees:
+            column = columns.get(emp.dept_code)
+            if column is None:
+                column = columns[emp.dept_code] = array('d')
+            column.append(emp.salary)
+        self.salaries = {}  # department code -> sorted salaries
+        self.prefix = {}    # department code -> prefix sums of the sorted salaries
+        for code, column in columns.items():
+            ordered = array('d', sorted(column))
+            self.salaries[code] = ordered
+            self.prefix[code] = array('d', accumulate(ordered, initial=0.0))
+
+    def current_totals(self):
+        '''
+        Return the current salary total per department name.
+        '''
+        return {self.departments.names[code]: prefix[-1] for code, prefix in self.prefix.items()}
+
+    def project(self, scenarios):
+        '''
+        Evaluate many scenarios in one batch.
+
+        :param scenarios: List of SalaryScenario objects.
+        :return: Dict of scenario name -> {department name: projected total}.
+        '''
+        names = [scenario.name for scenario in scenarios]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate scenario names: {', '.join(duplicates)}")
+        projections = {}
+        for scenario in scenarios:
+            scenario.resolve(self.departments)
+            totals = {}
+            for code, prefix in self.prefix.items():
+                rule = scenario.rule_for(code)
+                if rule is None:
+                    totals[self.departments.names[code]] = prefix[-1]
+                else:
+                    totals[self.departments.names[code]] = rule.project_total(self.salaries[code], prefix)
+            projections[scenario.name] = totals
+        return projections
@@ -1,6 +1,5 @@
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+# smtplib and email.mime are imported inside send_email() so that importing
+# this module (or constructing an EmailSender) stays cheap until a mail is sent.
 
 
 class EmailSender:
@@ -26,6 +25,10 @@ class EmailSender:
         :param subject: The email subject.
         :param body: The email body.
         '''
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+
         # Configure MIMEMultipart object
         msg = MIMEMultipart()
         msg["From"] = self.sender_email
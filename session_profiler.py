@@ -0,0 +1,133 @@
+import os
+import time
+import pstats
+import cProfile
+import functools
+import tracemalloc
+
+
+# Menu actions and persistence calls wrapped when profiling is enabled
+PROFILED_METHODS = [
+    "add_employee",
+    "view_employee",
+    "update_employee",
+    "delete_employee",
+    "list_all_employees",
+    "department_wise_report",
+    "load_employees",
+    "save_employees"
+]
+
+# Allocations made by the profiling machinery itself are left out of the top-lists
+_IGNORED_ALLOCATIONS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, __file__)
+]
+
+
+class SessionProfiler:
+    '''
+    Opt-in profiler for an interactive EMS session.
+    Writes a cProfile dump and a tracemalloc allocation top-list per action.
+    '''
+    def __init__(self, output_dir, top_allocations=10):
+        '''
+        Initialize the SessionProfiler instance.
+
+        :param output_dir: Directory the per-action dumps are written to (created if missing).
+        :param top_allocations: Number of allocation sites listed per action.
+        '''
+        self.output_dir = output_dir
+        self.top_allocations = top_allocations
+        self.stats = {}   # method name -> [calls, total seconds, net allocated bytes]
+        self.dumps = []   # Profile dump paths written in this session
+        self._depth = 0   # Nesting level; only the outermost call is profiled
+        os.makedirs(output_dir, exist_ok=True)
+
+    def instrument(self, ems):
+        '''
+        Wrap the profiled methods on a single EmployeeManagementSystem instance.
+        The class itself is left untouched, so unprofiled sessions pay nothing.
+
+        :param ems: The EmployeeManagementSystem instance to instrument.
+        '''
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        for name in PROFILED_METHODS:
+            setattr(ems, name, self.wrap(name, getattr(ems, name)))
+
+    def wrap(self, name, func):
+        '''
+        Return func wrapped with timing, cProfile and tracemalloc sampling.
+
+        :param name: Label used in the summary and dump file names.
+        :param func: The callable to wrap.
+        '''
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self._depth:
+                # Nested call (e.g. save inside add): already in the outer profile, only time it
+                self._depth += 1
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._depth -= 1
+                    self._record(name, time.perf_counter() - start, 0)
+
+            self._depth += 1
+            profile = cProfile.Profile()
+            before = tracemalloc.take_snapshot()
+            start = time.perf_counter()
+            profile.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.disable()
+                elapsed = time.perf_counter() - start
+                after = tracemalloc.take_snapshot()
+                self._depth -= 1
+                diff = after.filter_traces(_IGNORED_ALLOCATIONS).compare_to(
+                    before.filter_traces(_IGNORED_ALLOCATIONS), "lineno")
+                self._record(name, elapsed, sum(stat.size_diff for stat in diff))
+                self._dump(name, profile, diff)
+        return wrapper
+
+    def _record(self, name, elapsed, allocated):
+        entry = self.stats.setdefault(name, [0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += allocated
+
+    def _dump(self, name, profile, diff):
+        # Write <seq>_<name>.prof (load with pstats/snakeviz) and <seq>_<name>_alloc.txt
+        prefix = os.path.join(self.output_dir, f"{len(self.dumps) + 1:04d}_{name}")
+        try:
+            profile.dump_stats(prefix + ".prof")
+            self.dumps.append(prefix + ".prof")
+            with open(prefix + "_alloc.txt", 'w', encoding='utf-8') as f:
+                f.write(f"Top {self.top_allocations} allocation changes for {name}\n")
+                for stat in diff[:self.top_allocations]:
+                    f.write(f"{stat}\n")
+        except Exception as e:
+            print(f"Error writing profile for {name}: {e}")
+
+    def print_summary(self, limit=5):
+        '''
+        Print per-action call counts, time and net allocations, then the
+        slowest functions across all profile dumps of the session.
+
+        :param limit: Number of functions shown from the combined profile.
+        '''
+        print("\nProfiling Summary")
+        print("=" * 60)
+        print(f"{'Action':<24}{'Calls':>6}{'Total s':>10}{'Avg ms':>10}{'Net KB':>10}")
+        for name, (calls, total, allocated) in sorted(self.stats.items(), key=lambda item: -item[1][1]):
+            print(f"{name:<24}{calls:>6}{total:>10.3f}{total / calls * 1000:>10.2f}{allocated / 1024:>10.1f}")
+        print("=" * 60)
+
+        if self.dumps:
+            combined = pstats.Stats(*self.dumps)
+            combined.sort_stats("cumulative").print_stats(limit)
+        print(f"Profile dumps written to: {self.output_dir}")
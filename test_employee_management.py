@@ -1,3 +1,11 @@
+import os
+import csv
+import sys
+import random
+import time
+import tempfile
+import threading
+import tracemalloc
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 from io import StringIO
@@ -10,8 +18,31 @@ from BitFutura_Employee_Management_System import (
     validate_name,
     validate_department,
     validate_salary,
-    validate_contact
+    validate_contact,
+    DEPARTMENTS
 )
+from session_profiler import SessionProfiler
+from payroll import PayrollProjector, SalaryScenario, RaiseRule
+from change_feed import EventBus, ChangeFeed, ChangeFeedCursor, RosterEvent, EVENT_ADD, EVENT_UPDATE
+
+class RecordedEventsMixin:
+    """
+    Records the change events published by self.ems and closes its event bus after each test.
+    Call record_events() from setUp once self.ems exists.
+    """
+
+    def record_events(self):
+        """Subscribes self.received to the EMS event bus."""
+        self.received = []
+        self.ems.events.subscribe(self.received.append)
+
+    def delivered_events(self):
+        """Waits for pending deliveries and returns the events received so far."""
+        self.ems.events.flush()
+        return self.received
+
+    def tearDown(self):
+        self.ems.close_events()
 
 class TestEmployee(unittest.TestCase):
     """
@@ -49,7 +80,19 @@ class TestEmployee(unittest.TestCase):
         }
         self.assertEqual(self.employee.to_dict(), expected)
 
-class TestEmployeeManagementSystem(unittest.TestCase):
+    def test_employee_normalized_keys(self):
+        """Tests that department codes and contact keys are shared and kept in sync on update."""
+        other = Employee("E12345679", "Jane Roe", "hr", "4000", "Jane.Roe@Example.com")
+        self.assertEqual(other.dept_code, self.employee.dept_code)
+        self.assertEqual(other.contact_key, "jane.roe@example.com")
+
+        other.department = "Finance"
+        other.contact = "JR@example.com"
+        self.assertEqual(other.dept_code, DEPARTMENTS.lookup("FINANCE"))
+        self.assertNotEqual(other.dept_code, self.employee.dept_code)
+        self.assertEqual(other.contact_key, "jr@example.com")
+
+class TestEmployeeManagementSystem(RecordedEventsMixin, unittest.TestCase):
     """
     Unit tests for EmployeeManagementSystem class.
     Covers add, update, delete, search, view, and report functions.
@@ -60,6 +103,7 @@ class TestEmployeeManagementSystem(unittest.TestCase):
         self.ems = EmployeeManagementSystem()
         self.ems.employees = []
         self.ems.email_sender = MagicMock()  # Prevents actual emails from being sent
+        self.record_events()
 
     def test_validations(self):
         """Tests all validation helper functions with valid inputs."""
@@ -89,6 +133,15 @@ class TestEmployeeManagementSystem(unittest.TestCase):
         self.assertEqual(self.ems.employees[0].name, "Alice")
         self.ems.email_sender.send_email.assert_called_once()
 
+    @patch("builtins.input", side_effect=["E11111112", "Bob", "IT", "7000", "ALICE@example.com"])
+    def test_add_employee_duplicate_contact(self, mock_input):
+        """Tests that a contact differing only in case is rejected as a duplicate."""
+        self.ems.employees.append(Employee("E11111111", "Alice", "IT", "7000", "alice@example.com"))
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.ems.add_employee()
+            self.assertIn("Invalid or duplicate Contact Email", fake_out.getvalue())
+        self.assertEqual(len(self.ems.employees), 1)
+
     @patch("builtins.input", side_effect=["E99999999"])
     def test_view_employee_not_found(self, mock_input):
         """
@@ -148,6 +201,433 @@ class TestEmployeeManagementSystem(unittest.TestCase):
             self.assertIn("Beta", output)
             self.assertIn("Total Budgeted Salary for 'Hr': $10000.00", output)
 
+    def test_read_only_session_stays_lazy(self):
+        """
+        Tests that constructing the system imports neither the change feed nor
+        payroll modules and starts no event bus until a change is published.
+        """
+        with patch.dict(sys.modules):
+            sys.modules.pop("change_feed", None)
+            sys.modules.pop("payroll", None)
+            with patch("sys.stdout", new=StringIO()):
+                ems = EmployeeManagementSystem(change_feed_file="unused_changes.jsonl")
+            self.assertNotIn("change_feed", sys.modules)
+            self.assertNotIn("payroll", sys.modules)
+            self.assertIsNone(ems._events)
+            ems.close_events()  # Nothing to close
+            self.assertIsNone(ems._events)
+
+    def test_email_sender_is_lazy(self):
+        """
+        Tests that the email sender is only built on first access,
+        using credentials taken from the environment.
+        """
+        env = {"EMS_SENDER_EMAIL": "hr@example.com", "EMS_SENDER_PASSWORD": "secret"}
+        with patch.dict(sys.modules), patch.dict(os.environ, env):
+            sys.modules.pop("send_email", None)
+            with patch("sys.stdout", new=StringIO()):
+                ems = EmployeeManagementSystem()
+            self.assertIsNone(ems._email_sender)
+            self.assertNotIn("send_email", sys.modules)
+
+            sender = ems.email_sender
+            self.assertIn("send_email", sys.modules)
+            self.assertEqual(sender.sender_email, "hr@example.com")
+            self.assertEqual(sender.sender_password, "secret")
+            self.assertIs(ems.email_sender, sender)
+
+    @patch("builtins.input", side_effect=["E11111111", "Alice", "IT", "7000", "alice@example.com", "yes"])
+    @patch("builtins.open", new_callable=mock_open)
+    def test_add_employee_without_email_credentials(self, mock_file, mock_input):
+        """Tests that with no sender configured the welcome email is skipped with a clear message."""
+        self.ems.email_sender = None
+        env = {key: value for key, value in os.environ.items()
+               if key not in ("EMS_SENDER_EMAIL", "EMS_SENDER_PASSWORD")}
+        with patch.dict(os.environ, env, clear=True), patch("sys.stdout", new=StringIO()) as fake_out:
+            self.assertIsNone(self.ems.email_sender)
+            self.ems.add_employee()
+            output = fake_out.getvalue()
+        self.assertIn("Employee added successfully", output)
+        self.assertIn("EMS_SENDER_EMAIL", output)
+        self.assertIn("EMS_SENDER_PASSWORD", output)
+
+    @patch("builtins.input", side_effect=[
+        "E12345678", "yes",
+        "", "Admin", "9000", "", "yes"
+    ])
+    @patch("builtins.open", new_callable=mock_open)
+    def test_update_employee_publishes_event(self, mock_file, mock_input):
+        """
+        Tests that a confirmed update emits an update event
+        carrying the before and after field values.
+        """
+        emp = Employee("E12345678", "Original", "HR", "8000", "original@example.com")
+        self.ems.employees.append(emp)
+        with patch("sys.stdout", new=StringIO()):
+            self.ems.update_employee()
+
+        received = self.delivered_events()
+        self.assertEqual(len(received), 1)
+        event = received[0]
+        self.assertEqual(event.event_type, EVENT_UPDATE)
+        self.assertEqual(event.emp_id, "E12345678")
+        self.assertEqual(event.before["Department"], "HR")
+        self.assertEqual(event.after["Department"], "Admin")
+        self.assertEqual(event.changed_fields(), ["Department", "Salary"])
+
+    @patch("builtins.input", side_effect=[
+        "E12345678", "yes", "", "Cancelled Dept", "", "", "no",   # valid but not confirmed
+        "E12345678", "yes", "", "Bad Dept 9", "", ""             # invalid department
+    ])
+    def test_unsaved_update_does_not_register_department(self, mock_input):
+        """Tests that cancelled or invalid department updates get no department code."""
+        self.ems.employees.append(Employee("E12345678", "Original", "HR", "8000", "original@example.com"))
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.ems.update_employee()
+            self.ems.update_employee()
+            self.assertIn("Department: Cancelled Dept", fake_out.getvalue())
+        self.assertIsNone(DEPARTMENTS.lookup("Cancelled Dept"))
+        self.assertIsNone(DEPARTMENTS.lookup("Bad Dept 9"))
+        self.assertEqual(self.ems.employees[0].department, "HR")
+
+    @patch("builtins.input", side_effect=["E12345678", "yes", "yes"])
+    @patch("builtins.open", side_effect=OSError("disk full"))
+    def test_failed_save_publishes_no_event(self, mock_file, mock_input):
+        """Tests that no change event is emitted when the CSV write fails."""
+        self.ems.employees.append(Employee("E12345678", "ToDelete", "Ops", "6000", "delete@example.com"))
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.ems.delete_employee()
+            self.assertIn("Error saving employees", fake_out.getvalue())
+        self.assertEqual(self.delivered_events(), [])
+
+    def test_failed_saves_keep_feed_in_step_with_csv(self):
+        """
+        Tests that mutations whose save failed are rolled back, so a later
+        successful save writes no change the feed has not announced.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_file = os.path.join(tmp, "employees.csv")
+            feed_file = os.path.join(tmp, "changes.jsonl")
+            with patch("BitFutura_Employee_Management_System.FILE_NAME", csv_file), \
+                 patch("sys.stdout", new=StringIO()) as fake_out:
+                ems = EmployeeManagementSystem(change_feed_file=feed_file)
+                ems.email_sender = MagicMock()
+                ems.employees = [
+                    Employee("E22222222", "Keep", "Ops", "6000", "keep@example.com"),
+                    Employee("E33333333", "Gone", "Ops", "6000", "gone@example.com")
+                ]
+                ems.save_employees()
+
+                # Add and update whose saves fail
+                with patch("builtins.open", side_effect=OSError("disk full")):
+                    with patch("builtins.input", side_effect=["E11111111", "Alice", "IT", "7000", "alice@example.com", "yes"]):
+                        ems.add_employee()
+                    with patch("builtins.input", side_effect=["E22222222", "yes", "", "Admin", "", "", "yes"]):
+                        ems.update_employee()
+
+                # Delete whose save succeeds
+                with patch("builtins.input", side_effect=["E33333333", "yes", "yes"]):
+                    ems.delete_employee()
+                ems.close_events()
+                output = fake_out.getvalue()
+
+            self.assertNotIn("Employee added successfully", output)
+            self.assertNotIn("Employee E22222222 updated successfully", output)
+            ems.email_sender.send_email.assert_not_called()
+
+            with open(csv_file, newline='') as f:
+                rows = {row["ID"]: row for row in csv.DictReader(f)}
+            self.assertEqual(sorted(rows), ["E22222222"])
+            self.assertEqual(rows["E22222222"]["Department"], "Ops")
+            events = ChangeFeedCursor(ChangeFeed(feed_file), os.path.join(tmp, "c")).poll()
+            self.assertEqual([(e.event_type, e.emp_id) for e in events], [("delete", "E33333333")])
+
+class TestChangeFeed(unittest.TestCase):
+    """
+    Unit tests for the roster event bus, JSON-lines change feed and cursors.
+    """
+
+    def setUp(self):
+        """Creates a temporary directory for feed and cursor files."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.feed_file = os.path.join(self.tmp.name, "changes.jsonl")
+        self.cursor_file = os.path.join(self.tmp.name, "payroll.cursor")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_feed_cursor_resumes_after_commit(self):
+        """
+        Tests that a committed cursor only returns events written after it,
+        and that sequence numbers continue across bus restarts.
+        """
+        feed = ChangeFeed(self.feed_file)
+        bus = EventBus(feed.last_sequence())
+        bus.subscribe(feed.append)
+        bus.publish(EVENT_ADD, "E10000001", None, {"ID": "E10000001"})
+        bus.publish(EVENT_ADD, "E10000002", None, {"ID": "E10000002"})
+        bus.close()
+
+        cursor = ChangeFeedCursor(feed, self.cursor_file)
+        self.assertEqual([e.seq for e in cursor.poll()], [1, 2])
+        cursor.commit()
+
+        # Restart: new bus picks up the sequence, new cursor picks up the position
+        bus = EventBus(feed.last_sequence())
+        bus.subscribe(feed.append)
+        bus.publish(EVENT_ADD, "E10000003", None, {"ID": "E10000003"})
+        bus.close()
+
+        cursor = ChangeFeedCursor(feed, self.cursor_file)
+        events = cursor.poll()
+        self.assertEqual([e.seq for e in events], [3])
+        self.assertEqual(events[0].emp_id, "E10000003")
+
+    def test_feed_recovers_from_partial_line(self):
+        """
+        Tests that a half-written trailing line is ignored when resuming the
+        sequence and is replaced, not extended, by the next append.
+        """
+        with open(self.feed_file, 'w', encoding='utf-8') as f:
+            f.write('{"seq": 1, "type": "add", "emp_id": "E10000001", "before": null, "after": {}, "timestamp": 1.0}\n')
+            f.write('{"seq": 2, "ty')
+        feed = ChangeFeed(self.feed_file)
+        self.assertEqual(feed.last_sequence(), 1)
+
+        bus = EventBus(feed.last_sequence())
+        bus.subscribe(feed.append)
+        bus.publish(EVENT_ADD, "E10000002", None, {"ID": "E10000002"})
+        bus.close()
+
+        self.assertEqual(feed.last_sequence(), 2)
+        events = ChangeFeedCursor(feed, self.cursor_file).poll()
+        self.assertEqual([(e.seq, e.emp_id) for e in events], [(1, "E10000001"), (2, "E10000002")])
+
+        # A feed holding only a partial line starts from zero
+        with open(self.feed_file, 'w', encoding='utf-8') as f:
+            f.write('{"seq": 1, "ty')
+        self.assertEqual(ChangeFeed(self.feed_file).last_sequence(), 0)
+
+    def test_slow_subscriber_does_not_block_publish(self):
+        """
+        Tests that publishing returns immediately even when a subscriber is slow,
+        and that the slow subscriber still receives every event in order.
+        """
+        release = threading.Event()
+        received = []
+
+        def slow(event):
+            release.wait()
+            received.append(event.seq)
+
+        bus = EventBus()
+        bus.subscribe(slow)
+        for i in range(100):
+            bus.publish(EVENT_ADD, f"E{i:08d}", None, {})
+        # Every publish returned while the subscriber was still blocked on its first event
+        self.assertEqual(received, [])
+
+        release.set()
+        bus.close()
+        self.assertEqual(received, list(range(1, 101)))
+
+    def test_event_throughput(self):
+        """
+        Tests that the bus and change feed deliver a large burst of events
+        in sequence order. The rate is reported, not asserted.
+        """
+        count = 20000
+        feed = ChangeFeed(self.feed_file)
+        received = []
+        bus = EventBus()
+        bus.subscribe(feed.append)
+        bus.subscribe(received.append)
+        before = {"ID": "E10000001", "Salary": "1000.00"}
+        after = {"ID": "E10000001", "Salary": "2000.00"}
+        start = time.perf_counter()
+        for _ in range(count):
+            bus.publish(EVENT_UPDATE, "E10000001", before, after)
+        bus.close()
+        elapsed = time.perf_counter() - start
+        sys.stderr.write(f"\nchange feed throughput: {count / elapsed:,.0f} events/s\n")
+
+        self.assertEqual([e.seq for e in received], list(range(1, count + 1)))
+        self.assertEqual(feed.last_sequence(), count)
+        self.assertEqual(len(ChangeFeedCursor(feed, self.cursor_file).poll()), count)
+
+    def test_event_round_trip(self):
+        """Tests that events survive conversion to and from dicts."""
+        event = RosterEvent(7, EVENT_ADD, "E10000001", None, {"Name": "Alice"}, 123.0)
+        copy = RosterEvent.from_dict(event.to_dict())
+        self.assertEqual(copy.to_dict(), event.to_dict())
+        self.assertEqual(copy.changed_fields(), ["Name"])
+
+class TestPayrollScenarios(RecordedEventsMixin, unittest.TestCase):
+    """
+    Unit tests for batched salary scenario projections and applying a scenario.
+    """
+
+    def setUp(self):
+        """Creates an EMS with a small mixed-department roster and a mocked email sender."""
+        with patch("sys.stdout", new=StringIO()):
+            self.ems = EmployeeManagementSystem()
+        self.ems.email_sender = MagicMock()
+        self.ems.employees = [
+            Employee("E10000001", "Alpha", "Engineering", "4000", "a@example.com"),
+            Employee("E10000002", "Beta", "engineering", "9000", "b@example.com"),
+            Employee("E10000003", "Gamma", "Engineering", "12000", "c@example.com"),
+            Employee("E10000004", "Delta", "HR", "5000", "d@example.com")
+        ]
+        self.scenario = SalaryScenario("Eng +10% capped", [
+            RaiseRule(10, department="ENGINEERING", cap=9500),
+            RaiseRule(2)
+        ])
+        self.record_events()
+
+    def test_projection_matches_per_employee_rules(self):
+        """Tests projected totals against applying each rule employee by employee."""
+        totals = self.ems.project_salaries([self.scenario])["Eng +10% capped"]
+        self.assertAlmostEqual(totals["Engineering"], 4400 + 9500 + 12000)
+        self.assertAlmostEqual(totals["HR"], 5100)
+
+        # Randomised check of the prefix-sum shortcut against brute force
+        rng = random.Random(0)
+        salaries = sorted(rng.uniform(1000, 20000) for _ in range(500))
+        prefix = [0.0]
+        for salary in salaries:
+            prefix.append(prefix[-1] + salary)
+        for percent, cap in [(5, 12000), (25, 8000), (-10, 5000), (3, None), (50, 50000)]:
+            rule = RaiseRule(percent, cap=cap)
+            expected = sum(rule.apply(salary) for salary in salaries)
+            self.assertAlmostEqual(rule.project_total(salaries, prefix), expected, places=4)
+
+    def test_projection_does_not_mutate_roster(self):
+        """Tests that projecting many scenarios leaves salaries untouched."""
+        scenarios = [SalaryScenario(f"+{p}%", [RaiseRule(p)]) for p in range(1, 21)]
+        projections = PayrollProjector(self.ems.employees, DEPARTMENTS).project(scenarios)
+        self.assertEqual(len(projections), 20)
+        self.assertAlmostEqual(projections["+20%"]["HR"], 6000)
+        self.assertEqual([e.salary for e in self.ems.employees], [4000.0, 9000.0, 12000.0, 5000.0])
+
+    def test_duplicate_department_rules_rejected(self):
+        """Tests that two rules for the same department (any case) are rejected, even with nobody in it."""
+        with self.assertRaises(ValueError):
+            SalaryScenario("bad", [RaiseRule(1, "HR"), RaiseRule(2, "hr")])
+        with self.assertRaises(ValueError):
+            SalaryScenario("bad", [RaiseRule(1, "No Such Dept"), RaiseRule(2, "no such  dept")])
+        with self.assertRaises(ValueError):
+            SalaryScenario("bad", [RaiseRule(1), RaiseRule(2)])
+
+    def test_duplicate_scenario_names_rejected(self):
+        """Tests that scenarios sharing a name cannot silently overwrite each other's projection."""
+        scenarios = [SalaryScenario("same", [RaiseRule(1)]), SalaryScenario("same", [RaiseRule(2)])]
+        with self.assertRaises(ValueError):
+            self.ems.project_salaries(scenarios)
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_apply_scenario_saves_once_and_publishes(self, mock_file):
+        """
+        Tests that applying a scenario updates salaries as projected,
+        saves once, and emits one update event per changed employee.
+        """
+        projected = self.ems.project_salaries([self.scenario])["Eng +10% capped"]
+        with patch("sys.stdout", new=StringIO()):
+            changed = self.ems.apply_salary_scenario(self.scenario)
+        received = self.delivered_events()
+
+        self.assertEqual(changed, 3)  # Gamma is already above the cap
+        self.assertEqual(mock_file.call_count, 1)
+        self.assertEqual([e.salary for e in self.ems.employees][:3], [4400.0, 9500.0, 12000.0])
+        self.assertAlmostEqual(sum(e.salary for e in self.ems.employees), sum(projected.values()))
+        self.assertEqual(sorted(e.emp_id for e in received), ["E10000001", "E10000002", "E10000004"])
+        self.assertEqual(received[0].changed_fields(), ["Salary"])
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_apply_scenario_rounds_to_cents(self, mock_file):
+        """Tests that applied salaries are rounded to cents, matching the saved and published values."""
+        self.ems.employees = [Employee("E10000005", "Epsilon", "Legal", "1001", "e@example.com")]
+        with patch("sys.stdout", new=StringIO()):
+            self.ems.apply_salary_scenario(SalaryScenario("All +3.7%", [RaiseRule(3.7)]))
+        received = self.delivered_events()
+
+        emp = self.ems.employees[0]
+        self.assertEqual(emp.salary, 1038.04)
+        self.assertEqual(emp.to_dict()["Salary"], "1038.04")
+        self.assertEqual(float(received[0].after["Salary"]), emp.salary)
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_projection_within_rounding_tolerance_of_apply(self, mock_file):
+        """
+        Tests that with a non-integral percentage the projected total stays within
+        half a cent per employee of the total actually committed.
+        """
+        rng = random.Random(1)
+        self.ems.employees = [
+            Employee(f"E{20000000 + i}", "Staff", "Legal", str(rng.randint(1000, 20000)), f"s{i}@example.com")
+            for i in range(200)
+        ]
+        scenario = SalaryScenario("All +3.7%", [RaiseRule(3.7)])
+        projected = self.ems.project_salaries([scenario])["All +3.7%"]["Legal"]
+        with patch("sys.stdout", new=StringIO()):
+            self.ems.apply_salary_scenario(scenario)
+        committed = sum(e.salary for e in self.ems.employees)
+
+        self.assertNotEqual(round(projected, 2), round(committed, 2))  # Rounding does show up
+        self.assertLessEqual(abs(projected - committed), 0.005 * len(self.ems.employees))
+
+    @patch("builtins.open", side_effect=OSError("disk full"))
+    def test_apply_scenario_failed_save_rolls_back(self, mock_file):
+        """Tests that a failed save leaves salaries unchanged and publishes nothing."""
+        with patch("sys.stdout", new=StringIO()):
+            changed = self.ems.apply_salary_scenario(self.scenario)
+        received = self.delivered_events()
+
+        self.assertEqual(changed, 0)
+        self.assertEqual([e.salary for e in self.ems.employees], [4000.0, 9000.0, 12000.0, 5000.0])
+        self.assertEqual(received, [])
+
+class TestSessionProfiler(unittest.TestCase):
+    """
+    Unit tests for the opt-in session profiler.
+    """
+
+    def setUp(self):
+        """Creates a temporary directory for profile dumps."""
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        tracemalloc.stop() # Started by SessionProfiler.instrument
+        self.tmp.cleanup()
+
+    def test_profiling_disabled_leaves_methods_unwrapped(self):
+        """Tests that without a profiler no instance-level wrappers are installed."""
+        ems = EmployeeManagementSystem()
+        self.assertNotIn("department_wise_report", vars(ems))
+        self.assertNotIn("save_employees", vars(ems))
+
+    @patch("builtins.input", side_effect=["HR", "yes"])
+    def test_profiled_action_writes_dumps(self, mock_input):
+        """
+        Tests that a profiled action writes a profile dump and an allocation
+        top-list, and appears in the printed summary.
+        """
+        profiler = SessionProfiler(self.tmp.name)
+        with patch("sys.stdout", new=StringIO()):
+            ems = EmployeeManagementSystem(profiler=profiler)
+        ems.employees = [Employee("E10000001", "Alpha", "HR", "4000", "a@example.com")]
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            ems.department_wise_report()
+            self.assertIn("Alpha", fake_out.getvalue())
+
+        files = sorted(os.listdir(self.tmp.name))
+        self.assertIn("0002_department_wise_report.prof", files)
+        self.assertIn("0002_department_wise_report_alloc.txt", files)
+        self.assertEqual(profiler.stats["department_wise_report"][0], 1)
+
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            profiler.print_summary()
+            self.assertIn("department_wise_report", fake_out.getvalue())
+
 # Ensures test script can run directly from CLI or terminal
 if __name__ == "__main__":
     unittest.main()